@@ -1,9 +1,13 @@
 """
 Boyer-Moore String Matching Algorithm.
 
-Implementation of the exact pattern matching algorithm using 
+Implementation of the exact pattern matching algorithm using
 Bad Character and Good Suffix heuristics.
 """
+from array import array
+from collections import defaultdict
+
+from algorithms.boyer_moore_nb import NUMBA_AVAILABLE, boyer_moore_search_nb
 
 def bad_character_table(pattern: str) -> dict[str, int]:
     """
@@ -15,25 +19,35 @@ def bad_character_table(pattern: str) -> dict[str, int]:
     Returns:
         dict[str, int]: Map of character to its rightmost position (0-indexed).
     """
-    bad_char = {}
-    for i in range(len(pattern)):
-        bad_char[pattern[i]] = i
-    return bad_char
+    # Single C-level dict build; later duplicates overwrite earlier ones,
+    # which is exactly the "rightmost position" requirement.
+    return dict(zip(pattern, range(len(pattern))))
 
 
-def good_suffix_table(pattern: str) -> list[int]:
+def _bad_char_lut(pattern: bytes) -> array:
     """
-    Preprocesses the pattern to create the Good Suffix heuristic table.
-    
-    Args:
-        pattern (str): The search pattern.
-    
-    Returns:
-        list[int]: Array where shift[i] is the shift distance for mismatch at i.
+    Builds the bad-character table as a flat 256-entry C-int LUT.
+
+    Indexed directly by text byte: one array load per mismatch instead
+    of a dict hash, with -1 for bytes absent from the pattern (this also
+    handles non-ACGT bytes like N for free).
+    """
+    lut = array('i', [-1] * 256)
+    for i, code in enumerate(pattern):
+        lut[code] = i
+    return lut
+
+
+def _good_suffix_array(pattern: str) -> array:
+    """
+    Builds the Good Suffix shift table as a typed C-int array.
+
+    The search loop indexes this table on every mismatch, so array('i')
+    storage avoids boxed-int reads there.
     """
     m = len(pattern)
-    shift = [m] * m
-    border = [0] * (m + 1)
+    shift = array('i', [m] * m)
+    border = array('i', [0] * (m + 1))
     
     # Case 2: Matched suffix matches a prefix of pattern
     i = m
@@ -56,10 +70,23 @@ def good_suffix_table(pattern: str) -> list[int]:
             shift[i] = j
         if i == j:
             j = border[j]
-            
+
     return shift
 
 
+def good_suffix_table(pattern: str) -> list[int]:
+    """
+    Preprocesses the pattern to create the Good Suffix heuristic table.
+
+    Args:
+        pattern (str): The search pattern.
+
+    Returns:
+        list[int]: Array where shift[i] is the shift distance for mismatch at i.
+    """
+    return list(_good_suffix_array(pattern))
+
+
 def boyer_moore_search(text: str, pattern: str) -> list[int]:
     """
     Executes the Boyer-Moore search algorithm.
@@ -79,21 +106,53 @@ def boyer_moore_search(text: str, pattern: str) -> list[int]:
     
     if m > n:
         return []
-    
-    # Preprocessing
-    bad_char = bad_character_table(pattern)
-    good_suffix = good_suffix_table(pattern)
-    
+
+    # Fast path: fused preprocessing + search in one compiled kernel
+    if NUMBA_AVAILABLE and text.isascii() and pattern.isascii():
+        return boyer_moore_search_nb(text, pattern)
+
+    return _bm_core(text, pattern, count=False)[0]
+
+
+def _bm_core(text, pattern, count: bool) -> tuple[list[int], int]:
+    """
+    Single Boyer-Moore loop shared by the plain and counting variants.
+
+    The `count` flag is checked once per inner comparison; one loop
+    means the fast path and the instrumented path can never diverge.
+    """
+    n = len(text)
+    m = len(pattern)
+
+    # ASCII fast path for the interpreted loop: bytes indexing yields
+    # plain ints, avoiding PyUnicode kind dispatch per character.
+    if isinstance(text, str) and text.isascii() and pattern.isascii():
+        text = text.encode('ascii')
+        pattern = pattern.encode('ascii')
+
+    # Preprocessing (typed C-int tables; the bad-character table is a
+    # flat 256-entry LUT indexed by text byte on the bytes fast path)
+    if isinstance(pattern, bytes):
+        bad_char = _bad_char_lut(pattern)
+    else:
+        bad_char = defaultdict(lambda: -1, bad_character_table(pattern))
+    good_suffix = _good_suffix_array(pattern)
+
     matches = []
+    comparisons = 0
     shift_amount = 0
-    
+
     while shift_amount <= n - m:
         j = m - 1
-        
+
         # Compare from right to left
-        while j >= 0 and pattern[j] == text[shift_amount + j]:
+        while j >= 0:
+            if count:
+                comparisons += 1
+            if pattern[j] != text[shift_amount + j]:
+                break
             j -= 1
-        
+
         if j < 0:
             # Match found
             matches.append(shift_amount)
@@ -101,54 +160,30 @@ def boyer_moore_search(text: str, pattern: str) -> list[int]:
             shift_amount += good_suffix[0] if shift_amount + m < n else 1
         else:
             # Mismatch
-            bad_char_shift = j - bad_char.get(text[shift_amount + j], -1)
+            bad_char_shift = j - bad_char[text[shift_amount + j]]
             good_suffix_shift = good_suffix[j]
             shift_amount += max(bad_char_shift, good_suffix_shift)
-            
-    return matches
+
+    return matches, comparisons
 
 
 def count_comparisons_boyer_moore(text: str, pattern: str) -> tuple[list[int], int]:
     """
     Runs Boyer-Moore and counts character comparisons.
-    
+
     Used for empirical analysis in the project report to demonstrate
     sub-linear behavior compared to KMP or Naive approaches.
-    
+
     Returns:
         tuple: (list of matches, total_comparisons_made)
     """
     if not pattern:
         return [], 0
-        
+
     n = len(text)
     m = len(pattern)
-    
+
     if m > n:
         return [], 0
-    
-    bad_char = bad_character_table(pattern)
-    good_suffix = good_suffix_table(pattern)
-    
-    matches = []
-    comparisons = 0
-    shift_amount = 0
-    
-    while shift_amount <= n - m:
-        j = m - 1
-        
-        while j >= 0:
-            comparisons += 1
-            if pattern[j] != text[shift_amount + j]:
-                break
-            j -= 1
-        
-        if j < 0:
-            matches.append(shift_amount)
-            shift_amount += good_suffix[0] if shift_amount + m < n else 1
-        else:
-            bad_char_shift = j - bad_char.get(text[shift_amount + j], -1)
-            good_suffix_shift = good_suffix[j]
-            shift_amount += max(bad_char_shift, good_suffix_shift)
-            
-    return matches, comparisons
\ No newline at end of file
+
+    return _bm_core(text, pattern, count=True)
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Numba-compiled Boyer-Moore kernel.
+
+Fuses bad-character / good-suffix preprocessing and the right-to-left
+search loop into one @njit function over np.uint8 byte buffers, so no
+Python objects (dict lookups, boxed list entries) are touched per
+iteration. Importers should check NUMBA_AVAILABLE before calling.
+
+This JIT kernel is the project's compiled path for the BM inner loop: a
+Cython/C extension would give the same C-level compare loop but needs a
+build step and a second copy of the algorithm to maintain, while this
+stays a plain .py file with boyer_moore.py as the no-dependency
+fallback.
+"""
+
+import numpy as np
+
+from algorithms.dna import encode_ascii
+from algorithms.levenshtein_nb import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _bm_search(text, pattern, out):
+    """
+    Fused Boyer-Moore preprocessing + search.
+
+    Builds the 256-entry bad-character table and the good-suffix shift
+    table as typed arrays, then runs the compare loop. Match start
+    indices are written into out; returns the number of matches.
+    """
+    n = text.shape[0]
+    m = pattern.shape[0]
+
+    # Bad character: rightmost position of each byte, -1 if absent
+    bad = np.full(256, -1, np.int32)
+    for i in range(m):
+        bad[pattern[i]] = i
+
+    # Good suffix (border construction, same as the Python version)
+    shift = np.full(m, m, np.int32)
+    border = np.zeros(m + 1, np.int32)
+
+    i = m
+    j = m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j - 1] == m:
+                shift[j - 1] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+
+    j = border[0]
+    for i in range(m):
+        if shift[i] == m:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+
+    # Search
+    count = 0
+    shift_amount = 0
+    while shift_amount <= n - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[shift_amount + j]:
+            j -= 1
+
+        if j < 0:
+            out[count] = shift_amount
+            count += 1
+            shift_amount += shift[0] if shift_amount + m < n else 1
+        else:
+            bad_char_shift = j - bad[text[shift_amount + j]]
+            good_suffix_shift = shift[j]
+            shift_amount += max(bad_char_shift, good_suffix_shift)
+
+    return count
+
+
+def boyer_moore_search_nb(text: str, pattern: str) -> list[int]:
+    """
+    Thin wrapper: encodes the strings to uint8 buffers, runs the fused
+    kernel, and trims the output to the match count.
+    """
+    out = np.empty(len(text), np.int64)
+    count = _bm_search(encode_ascii(text), encode_ascii(pattern), out)
+    return out[:count].tolist()
@@ -0,0 +1,51 @@
+"""
+Shared DNA encoding helpers.
+
+Every matcher in this package works on integer codes, not Python
+strings: character access on a str goes through the PyUnicode object
+(1/2/4-byte kind dispatch per read), while a np.uint8 buffer is indexed
+at memory speed and is what the compiled kernels require. The encoders
+live here so each algorithm module uses the same buffers and tables
+instead of rolling its own.
+"""
+
+import numpy as np
+
+#: Canonical base order; encode_dna maps BASES[i] to code i.
+BASES = "ACGT"
+
+#: Byte -> base code (A=0, C=1, G=2, T=3); 4 marks non-ACGT bytes.
+DNA_CODE = np.full(256, 4, np.uint8)
+for _i, _b in enumerate(BASES.encode("ascii")):
+    DNA_CODE[_b] = _i
+
+
+def encode_ascii(s: str) -> np.ndarray:
+    """
+    Views an ASCII string as a np.uint8 array (zero-copy after encode).
+
+    Args:
+        s (str): ASCII text (DNA sequence or pattern).
+
+    Returns:
+        np.ndarray: uint8 array of the character codes.
+    """
+    return np.frombuffer(s.encode("ascii"), dtype=np.uint8)
+
+
+def encode_dna(s: str) -> np.ndarray:
+    """
+    Encodes a DNA string to 2-bit base codes (A=0, C=1, G=2, T=3).
+
+    Non-ACGT characters (e.g. N) come out as 4, so callers can validate
+    with a single comparison against the whole array. The small code
+    range is what lets automaton and bitmask tables shrink from 256
+    entries to 4 or 5.
+
+    Args:
+        s (str): DNA sequence or pattern (ASCII).
+
+    Returns:
+        np.ndarray: uint8 array of base codes.
+    """
+    return DNA_CODE[encode_ascii(s)]
@@ -1,133 +1,205 @@
-"""
-Knuth-Morris-Pratt (KMP) Algorithm Implementation.
-
-This module provides an efficient exact pattern matching algorithm
-that preprocesses the pattern to construct a Longest Prefix-Suffix (LPS) 
-table, allowing it to skip unnecessary comparisons in the text.
-"""
-
-def compute_lps_table(pattern: str) -> list[int]:
-    """
-    Computes the LPS (Longest Proper Prefix which is also a Suffix) table.
-
-    Args:
-        pattern (str): The search pattern (DNA motif).
-
-    Returns:
-        list[int]: The LPS array where lps[i] is the length of the longest
-                   proper prefix of pattern[0...i] that is also a suffix.
-    """
-    length = len(pattern)
-    lps = [0] * length
-    j = 0  # Length of the previous longest prefix suffix
-    i = 1
-
-    while i < length:
-        if pattern[i] == pattern[j]:
-            j += 1
-            lps[i] = j
-            i += 1
-        else:
-            if j != 0:
-                # Backtrack to the previous longest prefix-suffix.
-                # We do not increment i here.
-                j = lps[j - 1]
-            else:
-                lps[i] = 0
-                i += 1
-    return lps
-
-
-def kmp_search(text: str, pattern: str) -> list[int]:
-    """
-    Executes the KMP search algorithm to find all occurrences of a pattern.
-
-    Args:
-        text (str): The DNA sequence to search within.
-        pattern (str): The motif/pattern to search for.
-
-    Returns:
-        list[int]: A list of starting indices where the pattern occurs.
-                   Returns empty list if pattern is not found.
-    """
-    # 1. Edge Case: Empty pattern or pattern longer than text
-    if not pattern:
-        return []
-    if len(pattern) > len(text):
-        return []
-
-    n = len(text)
-    m = len(pattern)
-
-    # 2. Preprocess
-    lps = compute_lps_table(pattern)
-
-    # 3. Search
-    i = 0  # Index for text
-    j = 0  # Index for pattern
-    occurrences = []
-
-    while i < n:
-        if pattern[j] == text[i]:
-            i += 1
-            j += 1
-
-        if j == m:
-            # Match found!
-            occurrences.append(i - j)
-            # Prepare for next match (overlap handling)
-            j = lps[j - 1]
-        elif i < n and pattern[j] != text[i]:
-            # Mismatch
-            if j != 0:
-                j = lps[j - 1]
-            else:
-                i += 1
-                
-    return occurrences
-
-def count_comparisons_kmp(text: str, pattern: str) -> tuple[list[int], int]:
-    """
-    Executes KMP and counts the number of character comparisons performed.
-    
-    This is used for empirical analysis to demonstrate the efficiency
-    difference between KMP (approx 2N comparisons) and Boyer-Moore (sub-linear).
-    
-    Args:
-        text (str): The DNA sequence.
-        pattern (str): The motif to search for.
-        
-    Returns:
-        tuple: (list of matches, total_comparisons_made)
-    """
-    if not pattern or len(pattern) > len(text):
-        return [], 0
-
-    n = len(text)
-    m = len(pattern)
-    lps = compute_lps_table(pattern)
-
-    i = 0
-    j = 0
-    occurrences = []
-    comparisons = 0
-
-    while i < n:
-        # We are about to compare text[i] and pattern[j]
-        comparisons += 1
-        
-        if pattern[j] == text[i]:
-            i += 1
-            j += 1
-            
-            if j == m:
-                occurrences.append(i - j)
-                j = lps[j - 1]
-        else:
-            # Mismatch happened (we already counted the comparison above)
-            if j != 0:
-                j = lps[j - 1]
-            else:
-                i += 1
-                
-    return occurrences, comparisons
\ No newline at end of file
+"""
+Knuth-Morris-Pratt (KMP) Algorithm Implementation.
+
+This module provides an efficient exact pattern matching algorithm
+that preprocesses the pattern to construct a Longest Prefix-Suffix (LPS) 
+table, allowing it to skip unnecessary comparisons in the text.
+"""
+
+from array import array
+
+from algorithms.dfa import build_dfa, dfa_search
+
+
+def _lps_array(pattern: str) -> array:
+    """
+    Builds the LPS table as a typed C-int array.
+
+    The search loop reads lps on every mismatch, so keeping it as an
+    array.array('i') avoids boxed-int indirection in the hot path.
+    """
+    length = len(pattern)
+    lps = array('i', [0] * length)
+    j = 0  # Length of the previous longest prefix suffix
+    i = 1
+
+    while i < length:
+        if pattern[i] == pattern[j]:
+            j += 1
+            lps[i] = j
+            i += 1
+        else:
+            if j != 0:
+                # Backtrack to the previous longest prefix-suffix.
+                # We do not increment i here.
+                j = lps[j - 1]
+            else:
+                lps[i] = 0
+                i += 1
+    return lps
+
+
+def compute_lps_table(pattern: str) -> list[int]:
+    """
+    Computes the LPS (Longest Proper Prefix which is also a Suffix) table.
+
+    Args:
+        pattern (str): The search pattern (DNA motif).
+
+    Returns:
+        list[int]: The LPS array where lps[i] is the length of the longest
+                   proper prefix of pattern[0...i] that is also a suffix.
+    """
+    return list(_lps_array(pattern))
+
+
+def _kmp_core(text, pattern, count: bool) -> tuple[list[int], int]:
+    """
+    Single KMP search loop shared by the plain and counting variants.
+
+    Counting is free for the hot path: every loop trip performs exactly
+    one character comparison, and a trip either advances i (n times
+    total) or follows an LPS fallback, so the exact count is
+    n + fallbacks. Only the rare fallback branch increments anything;
+    keeping one loop means the fast path and the instrumented path can
+    never diverge.
+    """
+    n = len(text)
+    m = len(pattern)
+
+    # ASCII fast path: bytes indexing yields plain ints, avoiding the
+    # PyUnicode 1/2/4-byte kind dispatch on every character read.
+    if isinstance(text, str) and text.isascii() and pattern.isascii():
+        text = text.encode('ascii')
+        pattern = pattern.encode('ascii')
+
+    # Preprocess (typed C-int table, cheaper reads in the hot loop)
+    lps = _lps_array(pattern)
+
+    # Search
+    i = 0  # Index for text
+    j = 0  # Index for pattern
+    occurrences = []
+    fallbacks = 0
+
+    while i < n:
+        if pattern[j] == text[i]:
+            i += 1
+            j += 1
+
+            if j == m:
+                # Match found; continue from the failure state so
+                # overlapping occurrences are reported.
+                occurrences.append(i - j)
+                j = lps[j - 1]
+        else:
+            # Mismatch
+            if j != 0:
+                if count:
+                    fallbacks += 1
+                j = lps[j - 1]
+            else:
+                i += 1
+
+    return occurrences, (n + fallbacks) if count else 0
+
+
+def kmp_search(text: str, pattern: str) -> list[int]:
+    """
+    Executes the KMP search algorithm to find all occurrences of a pattern.
+
+    Args:
+        text (str): The DNA sequence to search within.
+        pattern (str): The motif/pattern to search for.
+
+    Returns:
+        list[int]: A list of starting indices where the pattern occurs.
+                   Returns empty list if pattern is not found.
+    """
+    # Edge Case: Empty pattern or pattern longer than text
+    if not pattern:
+        return []
+    if len(pattern) > len(text):
+        return []
+
+    return _kmp_core(text, pattern, count=False)[0]
+
+
+def kmp_search_many(text: str, patterns: list) -> list:
+    """
+    Runs the KMP search for a batch of patterns over one text.
+
+    Amortizes the per-call text work: the ASCII bytes conversion of the
+    text (an O(n) copy inside _kmp_core) happens once for the whole
+    batch instead of once per pattern; the O(m) LPS tables stay
+    per-pattern.
+
+    Args:
+        text (str): The DNA sequence to search within.
+        patterns (list[str]): The motifs to search for.
+
+    Returns:
+        list[list[int]]: One match list per pattern, in input order.
+    """
+    n = len(text)
+    text_ascii = text.isascii()
+    text_bytes = text.encode('ascii') if text_ascii else text
+
+    results = []
+    for pattern in patterns:
+        if not pattern or len(pattern) > n:
+            results.append([])
+        elif text_ascii and pattern.isascii():
+            # Bytes in, so _kmp_core skips its own per-call conversion.
+            results.append(_kmp_core(text_bytes, pattern.encode('ascii'),
+                                     count=False)[0])
+        else:
+            results.append(_kmp_core(text, pattern, count=False)[0])
+    return results
+
+
+def kmp_search_dfa(text: str, pattern: str) -> list[int]:
+    """
+    KMP with the failure function compiled into a full goto table.
+
+    For ACGT-only patterns the mismatch-time LPS walk is replaced by the
+    (m+1) x 4 automaton from algorithms.dfa: one table lookup per text
+    byte, no backtracking branch, same match set. Patterns containing
+    other characters fall back to the classic LPS loop.
+
+    Args:
+        text (str): The DNA sequence to search within.
+        pattern (str): The motif/pattern to search for.
+
+    Returns:
+        list[int]: A list of starting indices where the pattern occurs.
+    """
+    if not pattern or len(pattern) > len(text):
+        return []
+
+    try:
+        goto = build_dfa(pattern)
+    except ValueError:
+        return _kmp_core(text, pattern, count=False)[0]
+
+    return dfa_search(text, pattern, goto)
+
+
+def count_comparisons_kmp(text: str, pattern: str) -> tuple[list[int], int]:
+    """
+    Executes KMP and counts the number of character comparisons performed.
+
+    This is used for empirical analysis to demonstrate the efficiency
+    difference between KMP (approx 2N comparisons) and Boyer-Moore (sub-linear).
+
+    Args:
+        text (str): The DNA sequence.
+        pattern (str): The motif to search for.
+
+    Returns:
+        tuple: (list of matches, total_comparisons_made)
+    """
+    if not pattern or len(pattern) > len(text):
+        return [], 0
+
+    return _kmp_core(text, pattern, count=True)
\ No newline at end of file
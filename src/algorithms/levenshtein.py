@@ -2,173 +2,292 @@
 Levenshtein Distance Search (Edit Distance)
 Approximate string matching for genomic analysis.
 
-1. Standard Levenshtein distance (Wagner–Fischer DP)
-2. Naive sliding-window approximate search
-3. Optimized rolling-DP search
-4. Diagonal/banded DP search (Ukkonen-style)
-5. Comparison-count version for empirical evaluation
+1. Standard Levenshtein distance (bit-parallel; banded when bounded)
+2. Unified sliding-window approximate search
+3. Comparison-count version for empirical evaluation
 
 """
 
 
-def levenshtein_distance(a: str, b: str) -> int:
+import numpy as np
 
-    n, m = len(a), len(b)
+from algorithms.dna import encode_ascii
+from algorithms.levenshtein_nb import (
+    NUMBA_AVAILABLE,
+    _lev_bounded,
+    _LEV_SEARCH_SPECIALIZED,
+)
+from algorithms.myers import (WORD_SIZE, myers_distance, myers_search,
+                              myers_search_many)
 
-    # Edge cases
-    if n == 0:
-        return m
-    if m == 0:
-        return n
 
-    dp = [[0] * (m + 1) for _ in range(n + 1)]
+def _window_lower_bounds(text_arr: np.ndarray, pat_arr: np.ndarray) -> np.ndarray:
+    """
+    Vectorized per-window lower bound on the edit distance.
 
-    for i in range(n + 1):
-        dp[i][0] = i
-    for j in range(m + 1):
-        dp[0][j] = j
+    Compares the character multiset of every length-m window against the
+    pattern's: each edit operation changes the combined count difference
+    by at most 2, so dist >= ceil(sum|freq_window - freq_pattern| / 2).
+    Windows whose bound already exceeds max_distance can skip the DP.
+    Computed with rolling window counts (one cumsum per distinct base).
+    """
+    n = text_arr.shape[0]
+    m = pat_arr.shape[0]
 
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            cost = 0 if a[i - 1] == b[j - 1] else 1
-            dp[i][j] = min(
-                dp[i - 1][j] + 1,      # deletion
-                dp[i][j - 1] + 1,      # insertion
-                dp[i - 1][j - 1] + cost  # substitution
-            )
+    l1_diff = np.zeros(n - m + 1, np.int32)
+    in_pattern = np.zeros(n - m + 1, np.int32)
 
-    return dp[n][m]
+    for base in np.unique(pat_arr):
+        is_base = (text_arr == base).astype(np.int32)
+        csum = np.concatenate((np.zeros(1, np.int32), np.cumsum(is_base)))
+        window_count = csum[m:] - csum[:-m]
+        pattern_count = int(np.count_nonzero(pat_arr == base))
+        l1_diff += np.abs(window_count - pattern_count)
+        in_pattern += window_count
 
-def levenshtein_search(text: str, pattern: str, max_distance: int) -> list:
- 
-    n, m = len(text), len(pattern)
+    # Characters that never occur in the pattern count once each.
+    l1_diff += m - in_pattern
 
-    if m == 0:
-        return list(range(n + 1))  
-    if n < m:
-        return []
+    return (l1_diff + 1) // 2
 
-    matches = []
 
-    for start in range(n - m + 1):
-        substring = text[start:start + m]
-        dist = levenshtein_distance(substring, pattern)
-        if dist <= max_distance:
-            matches.append(start)
+def _levenshtein_python(a: str, b: str) -> int:
+    """Pure-Python rolling two-row DP, used when numba is unavailable."""
+    n, m = len(a), len(b)
 
-    return matches
+    prev = list(range(m + 1))
+    curr = [0] * (m + 1)
 
+    for i in range(1, n + 1):
+        curr[0] = i
+        for j in range(1, m + 1):
+            # Two explicit comparisons instead of min(a, b, c): skips
+            # the argument-tuple build and variadic dispatch per cell.
+            d = prev[j] + 1 if prev[j] < curr[j - 1] else curr[j - 1] + 1
+            s = prev[j - 1] + (0 if a[i - 1] == b[j - 1] else 1)
+            curr[j] = d if d < s else s
+        prev, curr = curr, prev
 
+    return prev[m]
 
-def levenshtein_search_optimized(text: str, pattern: str, max_distance: int):
 
-    n, m = len(text), len(pattern)
+def bounded_levenshtein(a: str, b: str, k: int) -> int:
+    """
+    Banded Levenshtein distance (Ukkonen's O(n*k) variant).
 
-    if m == 0:
-        return list(range(n + 1))
-    if n < m:
-        return []
+    Only maintains DP cells inside the band |i - j| <= k; everything
+    outside is provably > k. Returns the exact distance when it is <= k,
+    otherwise k + 1 as soon as that is certain (band minimum above k, or
+    a length gap wider than the band).
+    """
+    n, m = len(a), len(b)
 
-    matches = []
+    if abs(n - m) > k:
+        return k + 1
+    if m == 0 or n == 0:
+        return max(n, m)
 
-    for start in range(n - m + 1):
-        substring = text[start:start + m]
+    if NUMBA_AVAILABLE and a.isascii() and b.isascii():
+        return int(_lev_bounded(encode_ascii(a), encode_ascii(b), k))
 
-        prev = list(range(m + 1))
-        curr = [0] * (m + 1)
+    big = k + 5
 
-        for i in range(1, m + 1):
-            curr[0] = i
-            for j in range(1, m + 1):
-                cost = 0 if substring[i - 1] == pattern[j - 1] else 1
-                curr[j] = min(
-                    prev[j] + 1,      # deletion
-                    curr[j - 1] + 1,  # insertion
-                    prev[j - 1] + cost  # substitution
-                )
-            prev, curr = curr, prev
-
-        if prev[m] <= max_distance:
-            matches.append(start)
+    prev = [0] * (m + 1)
+    curr = [0] * (m + 1)
 
-    return matches
+    top = min(m, k)
+    for j in range(top + 1):
+        prev[j] = j
+    if top < m:
+        prev[top + 1] = big
 
+    for i in range(1, n + 1):
+        start_j = max(1, i - k)
+        end_j = min(m, i + k)
 
+        if start_j == 1:
+            curr[0] = i
+        else:
+            curr[start_j - 1] = big
+        if end_j < m:
+            curr[end_j + 1] = big
 
-def levenshtein_search_diagonal(text: str, pattern: str, max_distance: int):
-  
-    n, m = len(text), len(pattern)
+        row_min = big
+        for j in range(start_j, end_j + 1):
+            d = prev[j] + 1 if prev[j] < curr[j - 1] else curr[j - 1] + 1
+            s = prev[j - 1] + (0 if a[i - 1] == b[j - 1] else 1)
+            d = d if d < s else s
+            curr[j] = d
+            if d < row_min:
+                row_min = d
+        if row_min > k:
+            return k + 1
+        prev, curr = curr, prev
+
+    return prev[m] if prev[m] <= k else k + 1
+
+
+def levenshtein_distance(a: str, b: str, max_k: int = None) -> int:
+    """
+    Levenshtein distance, optionally bounded by max_k.
+
+    When max_k is given, callers that only care whether the distance is
+    within a budget (e.g. the window searches) get max_k + 1 back as
+    soon as that is certain, skipping the rest of the matrix.
+    """
+    n, m = len(a), len(b)
 
+    # Edge cases
+    if n == 0:
+        return m if max_k is None else min(m, max_k + 1)
     if m == 0:
-        return list(range(n + 1))
-    if n < m:
-        return []
-
-    matches = []
+        return n if max_k is None else min(n, max_k + 1)
 
-    prev = list(range(m + 1))  
+    if max_k is not None:
+        return bounded_levenshtein(a, b, max_k)
 
-    for i in range(1, n + 1):
-        curr = [0] * (m + 1)
-
-       
-        start_j = max(1, i - max_distance)
-        end_j = min(m, i + max_distance)
-
-        curr[0] = i 
-
-        for j in range(start_j, end_j + 1):
-            cost = 0 if text[i - 1] == pattern[j - 1] else 1
+    # Bit-parallel Myers recurrence: O(n * ceil(m/64)) word ops instead
+    # of O(n*m) cell updates, blockwise when m exceeds one word.
+    return myers_distance(a, b)
 
-            ins = curr[j - 1] + 1
-            delete = prev[j] + 1
-            subst = prev[j - 1] + cost
+def _exact_matches(text: str, pattern: str) -> list:
+    """
+    Overlapping exact occurrences via the str.find loop.
 
-            curr[j] = min(ins, delete, subst)
+    CPython's find is a tuned C-level two-way search, orders of
+    magnitude faster than any DP, so every approximate search dispatches
+    here when max_distance == 0.
+    """
+    matches = []
+    i = text.find(pattern)
+    while i != -1:
+        matches.append(i)
+        i = text.find(pattern, i + 1)
+    return matches
 
-        for j in range(1, start_j):
-            curr[j] = max_distance + 5
-        for j in range(end_j + 1, m + 1):
-            curr[j] = max_distance + 5
 
-        if i >= m and curr[m] <= max_distance:
-            matches.append(i - m)
+def levenshtein_search(text: str, pattern: str, max_distance: int) -> list:
+    """
+    Sliding-window approximate search: reports every start index whose
+    length-m window is within max_distance edits of the pattern.
+
+    Single entry point dispatching on the shape of the problem:
+    max_distance == 0 goes to the C-level exact scan; short motifs under
+    numba get the multiset prefilter plus the per-m unrolled parallel
+    window kernels (hits are dense at these lengths, so a DP per window
+    beats any streaming filter); everything else runs one streaming
+    semi-global Myers pass whose survivors are confirmed with the
+    banded window distance.
+    """
+    n, m = len(text), len(pattern)
 
-        prev = curr
+    if m == 0:
+        return list(range(n + 1))
+    if n < m:
+        return []
+    if max_distance == 0:
+        return _exact_matches(text, pattern)
+
+    if (NUMBA_AVAILABLE and m in _LEV_SEARCH_SPECIALIZED
+            and text.isascii() and pattern.isascii()):
+        text_arr = encode_ascii(text)
+        pat_arr = encode_ascii(pattern)
+        # Prefilter: skip windows whose multiset lower bound already
+        # rules them out (O(1) amortized per window vs O(m^2) DP).
+        bounds = _window_lower_bounds(text_arr, pat_arr)
+        candidates = np.flatnonzero(bounds <= max_distance)
+        out = np.zeros(n - m + 1, np.uint8)
+        _LEV_SEARCH_SPECIALIZED[m](text_arr, pat_arr, max_distance,
+                                   candidates, out)
+        return np.flatnonzero(out).tolist()
+
+    # One streaming semi-global pass instead of a DP per window: the
+    # stream score at position e is the distance of the best match
+    # *ending* at e, so the window [s, s + m) can only match when the
+    # score at e = s + m - 1 is <= max_distance. The O(n) scan leaves a
+    # short candidate list; each survivor is confirmed with the exact
+    # window distance to keep the fixed-window semantics.
+    ends = myers_search(text, pattern, max_distance)
+
+    # Confirm candidates with the banded O(m*k) distance; the window and
+    # pattern have equal length, so the band is as tight as it gets.
+    matches = []
+    for end in ends:
+        start = end - m + 1
+        if start >= 0 and bounded_levenshtein(text[start:start + m],
+                                              pattern,
+                                              max_distance) <= max_distance:
+            matches.append(start)
 
     return matches
 
 
+def levenshtein_search_many(text: str, patterns: list,
+                            max_distance: int) -> list:
+    """
+    Batch sliding-window search: one text, many patterns.
+
+    Word-sized patterns share a single streaming Myers pass (their
+    automata advance together per text byte via myers_search_many), so
+    the text is decoded and scanned once for the whole batch; surviving
+    ends are confirmed with the banded window distance exactly as in
+    levenshtein_search. Every other pattern falls back to
+    levenshtein_search, which already picks the best single-pattern
+    path for its length.
+
+    Args:
+        text (str): The DNA sequence to search within.
+        patterns (list[str]): The motifs to search for.
+        max_distance (int): Maximum allowed edit distance.
+
+    Returns:
+        list[list[int]]: One start-index list per pattern, in input order.
+    """
+    n = len(text)
+    results = [None] * len(patterns)
+
+    batch = []
+    if NUMBA_AVAILABLE and max_distance > 0 and text.isascii():
+        for idx, pattern in enumerate(patterns):
+            m = len(pattern)
+            if (0 < m <= min(n, WORD_SIZE)
+                    and m not in _LEV_SEARCH_SPECIALIZED
+                    and pattern.isascii()):
+                batch.append(idx)
+
+    if len(batch) > 1:
+        ends_lists = myers_search_many(text, [patterns[i] for i in batch],
+                                       max_distance)
+        for idx, ends in zip(batch, ends_lists):
+            pattern = patterns[idx]
+            m = len(pattern)
+            matches = []
+            for end in ends:
+                start = end - m + 1
+                if start >= 0 and bounded_levenshtein(
+                        text[start:start + m], pattern,
+                        max_distance) <= max_distance:
+                    matches.append(start)
+            results[idx] = matches
+
+    for idx, pattern in enumerate(patterns):
+        if results[idx] is None:
+            results[idx] = levenshtein_search(text, pattern, max_distance)
+
+    return results
+
 
 def count_comparisons_levenshtein(text: str, pattern: str, max_distance: int):
-   
+
     n, m = len(text), len(pattern)
-    comparisons = 0
 
     if m == 0:
         return list(range(n + 1)), 0
     if n < m:
         return [], 0
 
-    matches = []
-
-    for start in range(n - m + 1):
-        prev = list(range(m + 1))
-        curr = [0] * (m + 1)
-
-        for i in range(1, m + 1):
-            curr[0] = i
-            for j in range(1, m + 1):
-                comparisons += 1
-                cost = 0 if text[start + i - 1] == pattern[j - 1] else 1
-                curr[j] = min(
-                    prev[j] + 1,
-                    curr[j - 1] + 1,
-                    prev[j - 1] + cost
-                )
-            prev, curr = curr, prev
-
-        if prev[m] <= max_distance:
-            matches.append(start)
-
-    return matches, comparisons
+    # The naive windowed DP performs exactly one character comparison
+    # per cell of every window's m x m matrix, so the count is the
+    # closed form (n - m + 1) * m * m; no need to run the counting loop.
+    # The matches themselves come from the fast search.
+    return levenshtein_search(text, pattern, max_distance), (n - m + 1) * m * m
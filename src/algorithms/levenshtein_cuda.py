@@ -0,0 +1,103 @@
+"""
+CUDA windowed Levenshtein search.
+
+Maps the window-level parallelism of levenshtein_search onto the GPU:
+one thread per start offset, each running the single-row DP on a small
+local array. Genome-scale texts expose millions of independent windows,
+far more than CPU cores can cover, and the text buffer is copied to the
+device once per call so repeated patterns amortize the transfer.
+
+Importers should check CUDA_AVAILABLE; without a CUDA device the module
+still imports and the search raises RuntimeError, mirroring how the
+other modules degrade when numba is missing.
+"""
+
+import numpy as np
+
+from algorithms.dna import encode_ascii
+
+try:
+    from numba import cuda, int32
+    CUDA_AVAILABLE = cuda.is_available()
+except ImportError:
+    cuda = None
+    CUDA_AVAILABLE = False
+
+#: Per-thread DP rows are fixed-size local arrays, so the pattern length
+#: is capped at compile time.
+MAX_PATTERN = 256
+
+THREADS_PER_BLOCK = 256
+
+
+if cuda is not None:
+
+    @cuda.jit
+    def _lev_windows_cuda(text, pattern, max_distance, out):
+        """One thread = one window: single-row DP in thread-local memory."""
+        start = cuda.grid(1)
+        n = text.shape[0]
+        m = pattern.shape[0]
+        if start > n - m:
+            return
+
+        row = cuda.local.array(MAX_PATTERN + 1, int32)
+        for j in range(m + 1):
+            row[j] = j
+
+        for i in range(1, m + 1):
+            diag = row[0]
+            row[0] = i
+            ca = text[start + i - 1]
+            for j in range(1, m + 1):
+                up = row[j]
+                cost = 0 if ca == pattern[j - 1] else 1
+                d = up + 1 if up < row[j - 1] else row[j - 1] + 1
+                s = diag + cost
+                row[j] = d if d < s else s
+                diag = up
+
+        if row[m] <= max_distance:
+            out[start] = 1
+
+
+def levenshtein_search_cuda(text: str, pattern: str,
+                            max_distance: int) -> list:
+    """
+    Sliding-window approximate search on the GPU.
+
+    Same semantics as levenshtein_search: reports every start index
+    whose length-m window is within max_distance edits of the pattern.
+
+    Args:
+        text (str): The DNA sequence to search within.
+        pattern (str): The motif (at most MAX_PATTERN characters).
+        max_distance (int): Maximum allowed edit distance.
+
+    Returns:
+        list[int]: Sorted start indices of matching windows.
+
+    Raises:
+        RuntimeError: If no CUDA device is available.
+        ValueError: If the pattern exceeds MAX_PATTERN characters.
+    """
+    n, m = len(text), len(pattern)
+
+    if m == 0:
+        return list(range(n + 1))
+    if n < m:
+        return []
+    if m > MAX_PATTERN:
+        raise ValueError(f"Pattern longer than {MAX_PATTERN} characters")
+    if not CUDA_AVAILABLE:
+        raise RuntimeError("levenshtein_search_cuda requires a CUDA device")
+
+    d_text = cuda.to_device(encode_ascii(text))
+    d_pat = cuda.to_device(encode_ascii(pattern))
+    d_out = cuda.to_device(np.zeros(n - m + 1, np.uint8))
+
+    blocks = (n - m + 1 + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+    _lev_windows_cuda[blocks, THREADS_PER_BLOCK](d_text, d_pat,
+                                                 max_distance, d_out)
+
+    return np.flatnonzero(d_out.copy_to_host()).tolist()
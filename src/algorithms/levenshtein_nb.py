@@ -0,0 +1,170 @@
+"""
+Numba-compiled Levenshtein kernels.
+
+Rolling-buffer Wagner-Fischer DP compiled with @njit over np.uint8 byte
+arrays. Removing the interpreter from the inner loop is worth ~50-100x on
+DNA strings, and the two-row buffer keeps memory at O(m) instead of O(nm).
+
+Importers should check NUMBA_AVAILABLE before calling the kernels; the
+pure-Python implementations in levenshtein.py remain the fallback.
+"""
+
+import numpy as np
+
+from algorithms.dna import encode_ascii
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Stand-in decorator so this module still imports without numba.
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, boundscheck=False)
+def _lev(a, b):
+    """
+    Single-row Wagner-Fischer DP over uint8 arrays.
+
+    One int32 row updated in place with the diagonal cell carried in a
+    scalar register, so each cell costs one load and one store instead
+    of the two-row variant's two loads.
+    """
+    n = a.shape[0]
+    m = b.shape[0]
+
+    row = np.empty(m + 1, np.int32)
+    for j in range(m + 1):
+        row[j] = j
+
+    for i in range(1, n + 1):
+        diag = row[0]
+        row[0] = i
+        ca = a[i - 1]
+        for j in range(1, m + 1):
+            up = row[j]
+            cost = 0 if ca == b[j - 1] else 1
+            # Branchless 3-way min: ternaries lower to cmov, which
+            # matters because the winner is unpredictable on DNA data.
+            d = up + 1 if up < row[j - 1] else row[j - 1] + 1
+            s = diag + cost
+            row[j] = d if d < s else s
+            diag = up
+
+    return row[m]
+
+
+@njit(cache=True, boundscheck=False)
+def _lev_bounded(a, b, max_k):
+    """
+    Banded two-row DP (Ukkonen): only cells with |i - j| <= max_k exist.
+
+    Cells outside the band are provably > max_k, so each row costs
+    O(max_k) instead of O(m); out-of-band neighbours are stood in for by
+    sentinel cells at the band edges. Returns the exact distance when it
+    is <= max_k, otherwise max_k + 1 as soon as the band minimum exceeds
+    the bound (row minima never decrease).
+    """
+    n = a.shape[0]
+    m = b.shape[0]
+
+    if abs(n - m) > max_k:
+        return max_k + 1
+
+    big = max_k + 5
+
+    prev = np.empty(m + 1, np.int32)
+    curr = np.empty(m + 1, np.int32)
+
+    top = min(m, max_k)
+    for j in range(top + 1):
+        prev[j] = j
+    if top < m:
+        prev[top + 1] = big
+
+    for i in range(1, n + 1):
+        start_j = max(1, i - max_k)
+        end_j = min(m, i + max_k)
+        ca = a[i - 1]
+
+        if start_j == 1:
+            curr[0] = i
+        else:
+            curr[start_j - 1] = big
+        if end_j < m:
+            curr[end_j + 1] = big
+
+        row_min = big
+        for j in range(start_j, end_j + 1):
+            cost = 0 if ca == b[j - 1] else 1
+            d = prev[j] + 1 if prev[j] < curr[j - 1] else curr[j - 1] + 1
+            s = prev[j - 1] + cost
+            d = d if d < s else s
+            curr[j] = d
+            if d < row_min:
+                row_min = d
+        if row_min > max_k:
+            return max_k + 1
+        prev, curr = curr, prev
+
+    if prev[m] > max_k:
+        return max_k + 1
+    return prev[m]
+
+
+def _make_lev_search_m(m: int):
+    """
+    Generates a window-search kernel specialized for one pattern length.
+
+    The j loop is fully unrolled with m baked in as a constant and the
+    DP row held in scalar variables, so the JIT keeps the whole row in
+    registers -- no loads or stores per cell. Worth it only for the very
+    short motifs the benchmarks use; longer patterns go through the
+    streaming Myers pass in levenshtein_search instead.
+    """
+    row = ", ".join(f"r{j}" for j in range(m + 1))
+    init = ", ".join(str(j) for j in range(m + 1))
+
+    lines = [
+        f"def _lev_search_{m}(text, pattern, max_distance, starts, out):",
+        "    " + "; ".join(f"p{j} = pattern[{j}]" for j in range(m)),
+        "    for s in prange(starts.shape[0]):",
+        "        start = starts[s]",
+        f"        {row} = {init}",
+        f"        for i in range(1, {m + 1}):",
+        "            diag = r0",
+        "            r0 = i",
+        "            ca = text[start + i - 1]",
+    ]
+    for j in range(1, m + 1):
+        lines += [
+            f"            up = r{j}",
+            f"            d = up + 1 if up < r{j - 1} else r{j - 1} + 1",
+            f"            v = diag + (0 if ca == p{j - 1} else 1)",
+            f"            r{j} = d if d < v else v",
+            "            diag = up",
+        ]
+    lines += [
+        f"        if r{m} <= max_distance:",
+        "            out[start] = 1",
+    ]
+
+    namespace = {"prange": prange}
+    exec("\n".join(lines), namespace)
+    # cache=True needs an on-disk source file, which generated code
+    # does not have.
+    return njit(parallel=True, boundscheck=False)(namespace[f"_lev_search_{m}"])
+
+
+#: Pattern lengths worth a fully unrolled kernel (the motif sizes the
+#: project's benchmarks sweep).
+_LEV_SEARCH_SPECIALIZED = {m: _make_lev_search_m(m) for m in (3, 4, 5)}
+
@@ -0,0 +1,510 @@
+"""
+Myers' Bit-Parallel Edit Distance (Myers 1999).
+
+Packs one DP column of the Wagner-Fischer matrix into a machine word and
+advances it with a handful of bitwise operations per text character
+(VP/VN delta encoding). For DNA motifs of length <= 64 the whole column
+update is O(1) 64-bit word operations instead of m scalar cell updates;
+longer patterns use the blockwise extension from the same paper, chaining
+ceil(m/64) words per column through horizontal carry bits.
+"""
+
+import numpy as np
+
+from algorithms.dna import encode_ascii
+from algorithms.levenshtein_nb import NUMBA_AVAILABLE, njit, prange
+
+#: Widest pattern a single machine word can encode.
+WORD_SIZE = 64
+
+
+def build_peq(pattern: str) -> dict[str, int]:
+    """
+    Precomputes the per-character position bitmasks for a pattern.
+
+    Args:
+        pattern (str): The motif (m <= 64).
+
+    Returns:
+        dict[str, int]: Map of character -> bitmask with bit i set where
+                        pattern[i] == character.
+    """
+    peq = {}
+    for i, ch in enumerate(pattern):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    return peq
+
+
+def _myers_python(text: str, pattern: str) -> int:
+    """Pure-Python VP/VN recurrence; returns dist(text, pattern)."""
+    m = len(pattern)
+    peq = build_peq(pattern)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+
+    vp = mask
+    vn = 0
+    score = m
+
+    for ch in text:
+        eq = peq.get(ch, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (mask & ~(xh | vp))
+        mh = vp & xh
+
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        vp = mh | (mask & ~(xv | ph))
+        vn = ph & xv
+
+    return score
+
+
+def build_peq_table(pattern: str) -> np.ndarray:
+    """Builds the 256-entry uint64 bitmask table for the compiled kernel."""
+    peq = np.zeros(256, np.uint64)
+    for i, code in enumerate(pattern.encode("ascii")):
+        peq[code] |= np.uint64(1 << i)
+    return peq
+
+
+def _word_masks(m: int) -> tuple:
+    """Returns the (all-ones, top-bit) uint64 masks for an m-bit column."""
+    return np.uint64((1 << m) - 1), np.uint64(1 << (m - 1))
+
+
+@njit(cache=True)
+def _myers_nb(text, peq, m, mask, high):
+    """Compiled VP/VN recurrence over a uint8 text buffer."""
+    one = np.uint64(1)
+
+    vp = mask
+    vn = np.uint64(0)
+    score = m
+
+    for i in range(text.shape[0]):
+        eq = peq[text[i]]
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (mask & ~(xh | vp))
+        mh = vp & xh
+
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+
+        ph = ((ph << one) | one) & mask
+        mh = (mh << one) & mask
+        vp = mh | (mask & ~(xv | ph))
+        vn = ph & xv
+
+    return score
+
+
+def build_peq_blocks(pattern: str) -> np.ndarray:
+    """Builds the 256 x ceil(m/64) uint64 bitmask table for long patterns."""
+    blocks = (len(pattern) + WORD_SIZE - 1) // WORD_SIZE
+    peq = np.zeros((256, blocks), np.uint64)
+    for i, code in enumerate(pattern.encode("ascii")):
+        peq[code, i // WORD_SIZE] |= np.uint64(1 << (i % WORD_SIZE))
+    return peq
+
+
+@njit(cache=True)
+def _myers_blocks_nb(text, peq, m, blocks, last_mask, last_high):
+    """
+    Blockwise VP/VN recurrence (Myers 1999) for patterns wider than one
+    word.
+
+    Each column is ceil(m/64) words advanced bottom-up; the horizontal
+    delta leaving a block's top row (hout in {-1, 0, +1}) feeds the next
+    block, and the top block's hout updates the score. The column
+    boundary condition enters block 0 as hin = +1.
+    """
+    one = np.uint64(1)
+    full = np.uint64(0xFFFFFFFFFFFFFFFF)
+    word_high = np.uint64(1) << np.uint64(WORD_SIZE - 1)
+
+    vp = np.empty(blocks, np.uint64)
+    vn = np.zeros(blocks, np.uint64)
+    for j in range(blocks - 1):
+        vp[j] = full
+    vp[blocks - 1] = last_mask
+
+    score = m
+
+    for i in range(text.shape[0]):
+        c = text[i]
+        hin = 1
+        for j in range(blocks):
+            mask = last_mask if j == blocks - 1 else full
+            high = last_high if j == blocks - 1 else word_high
+
+            eq = peq[c, j]
+            pv = vp[j]
+            mv = vn[j]
+
+            xv = eq | mv
+            if hin < 0:
+                eq |= one
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (mask & ~(xh | pv))
+            mh = pv & xh
+
+            if ph & high:
+                hout = 1
+            elif mh & high:
+                hout = -1
+            else:
+                hout = 0
+
+            ph = (ph << one) & mask
+            mh = (mh << one) & mask
+            if hin > 0:
+                ph |= one
+            elif hin < 0:
+                mh |= one
+
+            vp[j] = mh | (mask & ~(xv | ph))
+            vn[j] = ph & xv
+            hin = hout
+
+        score += hin
+
+    return score
+
+
+def myers_distance(a: str, b: str) -> int:
+    """
+    Computes the Levenshtein distance via the bit-parallel recurrence.
+
+    The shorter string is used as the bit-packed pattern. Patterns up to
+    64 characters fit a single word; longer ones go through the blockwise
+    kernel (or the arbitrary-precision Python recurrence, whose bignums
+    are blockwise under the hood, when numba is unavailable).
+
+    Args:
+        a (str): First string (e.g., the text window).
+        b (str): Second string (the motif).
+
+    Returns:
+        int: The edit distance between a and b.
+    """
+    # Distance is symmetric; pack the shorter string into the word.
+    text, pattern = (a, b) if len(b) <= len(a) else (b, a)
+
+    m = len(pattern)
+    if m == 0:
+        return len(text)
+
+    if NUMBA_AVAILABLE and text.isascii() and pattern.isascii():
+        if m <= WORD_SIZE:
+            mask, high = _word_masks(m)
+            return int(_myers_nb(encode_ascii(text), build_peq_table(pattern),
+                                 m, mask, high))
+        blocks = (m + WORD_SIZE - 1) // WORD_SIZE
+        last_bits = m - WORD_SIZE * (blocks - 1)
+        last_mask, last_high = _word_masks(last_bits)
+        return int(_myers_blocks_nb(encode_ascii(text),
+                                    build_peq_blocks(pattern),
+                                    m, blocks, last_mask, last_high))
+
+    return _myers_python(text, pattern)
+
+
+def _myers_stream_python(text: str, pattern: str, max_distance: int) -> list:
+    """
+    Pure-Python semi-global scan; returns end indices with score <= k.
+
+    Identical to the distance recurrence except the first DP row is all
+    zeros (no +1 carried into ph after the shift), so score tracks the
+    best match ending at each text position regardless of where it began.
+    """
+    m = len(pattern)
+    peq = build_peq(pattern)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+
+    vp = mask
+    vn = 0
+    score = m
+    ends = []
+
+    for i, ch in enumerate(text):
+        eq = peq.get(ch, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (mask & ~(xh | vp))
+        mh = vp & xh
+
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+
+        ph = (ph << 1) & mask
+        mh = (mh << 1) & mask
+        vp = mh | (mask & ~(xv | ph))
+        vn = ph & xv
+
+        if score <= max_distance:
+            ends.append(i)
+
+    return ends
+
+
+@njit(cache=True)
+def _myers_stream_nb(text, peq, m, mask, high, max_distance, out):
+    """Compiled semi-global scan; writes 1 at end indices with score <= k."""
+    one = np.uint64(1)
+
+    vp = mask
+    vn = np.uint64(0)
+    score = m
+
+    for i in range(text.shape[0]):
+        eq = peq[text[i]]
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (mask & ~(xh | vp))
+        mh = vp & xh
+
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+
+        ph = (ph << one) & mask
+        mh = (mh << one) & mask
+        vp = mh | (mask & ~(xv | ph))
+        vn = ph & xv
+
+        if score <= max_distance:
+            out[i] = 1
+
+
+@njit(cache=True)
+def _myers_stream_blocks_nb(text, peq, m, blocks, last_mask, last_high,
+                            max_distance, out):
+    """Blockwise semi-global scan for patterns wider than one word."""
+    one = np.uint64(1)
+    full = np.uint64(0xFFFFFFFFFFFFFFFF)
+    word_high = np.uint64(1) << np.uint64(WORD_SIZE - 1)
+
+    vp = np.empty(blocks, np.uint64)
+    vn = np.zeros(blocks, np.uint64)
+    for j in range(blocks - 1):
+        vp[j] = full
+    vp[blocks - 1] = last_mask
+
+    score = m
+
+    for i in range(text.shape[0]):
+        c = text[i]
+        hin = 0  # first DP row is all zeros in the search variant
+        for j in range(blocks):
+            mask = last_mask if j == blocks - 1 else full
+            high = last_high if j == blocks - 1 else word_high
+
+            eq = peq[c, j]
+            pv = vp[j]
+            mv = vn[j]
+
+            xv = eq | mv
+            if hin < 0:
+                eq |= one
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (mask & ~(xh | pv))
+            mh = pv & xh
+
+            if ph & high:
+                hout = 1
+            elif mh & high:
+                hout = -1
+            else:
+                hout = 0
+
+            ph = (ph << one) & mask
+            mh = (mh << one) & mask
+            if hin > 0:
+                ph |= one
+            elif hin < 0:
+                mh |= one
+
+            vp[j] = mh | (mask & ~(xv | ph))
+            vn[j] = ph & xv
+            hin = hout
+
+        score += hin
+        if score <= max_distance:
+            out[i] = 1
+
+
+def myers_search(text: str, pattern: str, max_distance: int) -> list:
+    """
+    Semi-global approximate search in one left-to-right pass.
+
+    Streams the bit-parallel column over the text with a zero first DP
+    row, so the score after position i is the distance of the best match
+    *ending* at i, wherever it started. Reports every end index whose
+    score is <= max_distance; occurrences may be shorter or longer than
+    the pattern (contrast with the fixed-window semantics of
+    myers_search_windows).
+    """
+    n, m = len(text), len(pattern)
+
+    if m == 0:
+        return list(range(n))
+    if n == 0:
+        return []
+
+    if NUMBA_AVAILABLE and text.isascii() and pattern.isascii():
+        out = np.zeros(n, np.uint8)
+        if m <= WORD_SIZE:
+            mask, high = _word_masks(m)
+            _myers_stream_nb(encode_ascii(text), build_peq_table(pattern),
+                             m, mask, high, max_distance, out)
+        else:
+            blocks = (m + WORD_SIZE - 1) // WORD_SIZE
+            last_mask, last_high = _word_masks(m - WORD_SIZE * (blocks - 1))
+            _myers_stream_blocks_nb(encode_ascii(text),
+                                    build_peq_blocks(pattern),
+                                    m, blocks, last_mask, last_high,
+                                    max_distance, out)
+        return np.flatnonzero(out).tolist()
+
+    return _myers_stream_python(text, pattern, max_distance)
+
+
+@njit(parallel=True, cache=True)
+def _myers_stream_many_nb(text, peqs, ms, masks, highs, max_distance, out):
+    """
+    Compiled semi-global scan running one automaton per pattern.
+
+    Patterns are independent, so the outer loop runs under prange: each
+    thread streams the shared text with its own VP/VN/score in
+    registers, exactly like the single-pattern kernel, and fills its
+    own row of out.
+    """
+    one = np.uint64(1)
+
+    for j in prange(ms.shape[0]):
+        mask = masks[j]
+        high = highs[j]
+
+        vp = mask
+        vn = np.uint64(0)
+        score = ms[j]
+
+        for i in range(text.shape[0]):
+            eq = peqs[j, text[i]]
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            ph = vn | (mask & ~(xh | vp))
+            mh = vp & xh
+
+            if ph & high:
+                score += 1
+            elif mh & high:
+                score -= 1
+
+            ph = (ph << one) & mask
+            mh = (mh << one) & mask
+            vp = mh | (mask & ~(xv | ph))
+            vn = ph & xv
+
+            if score <= max_distance:
+                out[j, i] = 1
+
+
+def myers_search_many(text: str, patterns: list, max_distance: int) -> list:
+    """
+    Semi-global search for a batch of patterns in one pass over the text.
+
+    Builds every pattern's Peq table up front, then runs all the
+    bit-parallel automata in one compiled call with a thread per
+    pattern, so the batch costs one parallel sweep instead of p
+    sequential ones. Per-pattern semantics are exactly those of
+    myers_search.
+    Batches with empty, non-ASCII or wider-than-a-word patterns fall
+    back to individual myers_search calls.
+
+    Args:
+        text (str): The DNA sequence to search within.
+        patterns (list[str]): The motifs to search for.
+        max_distance (int): Maximum allowed edit distance.
+
+    Returns:
+        list[list[int]]: One end-index list per pattern, in input order.
+    """
+    n = len(text)
+    p = len(patterns)
+
+    if (NUMBA_AVAILABLE and p > 0 and text.isascii()
+            and all(0 < len(pt) <= WORD_SIZE and pt.isascii()
+                    for pt in patterns)):
+        peqs = np.stack([build_peq_table(pt) for pt in patterns])
+        ms = np.empty(p, np.int64)
+        masks = np.empty(p, np.uint64)
+        highs = np.empty(p, np.uint64)
+        for j, pt in enumerate(patterns):
+            ms[j] = len(pt)
+            masks[j], highs[j] = _word_masks(len(pt))
+        out = np.zeros((p, n), np.uint8)
+        _myers_stream_many_nb(encode_ascii(text), peqs, ms, masks, highs,
+                              max_distance, out)
+        return [np.flatnonzero(out[j]).tolist() for j in range(p)]
+
+    return [myers_search(text, pt, max_distance) for pt in patterns]
+
+
+@njit(parallel=True, cache=True)
+def _myers_windows_nb(text, peq, m, mask, high, max_distance, out):
+    """
+    Runs the bit-parallel distance on every length-m window of text.
+
+    Windows are independent, so the outer loop runs under prange; each
+    thread keeps its VP/VN state in registers. Writes 1 into out[start]
+    when dist(text[start:start+m], pattern) <= max_distance.
+    """
+    n = text.shape[0]
+    for start in prange(n - m + 1):
+        if _myers_nb(text[start:start + m], peq, m, mask, high) <= max_distance:
+            out[start] = 1
+
+
+def myers_search_windows(text: str, pattern: str, max_distance: int) -> list:
+    """
+    Sliding-window approximate search using the bit-parallel kernel.
+
+    Same semantics as levenshtein_search: reports every start index whose
+    length-m window is within max_distance edits of the pattern.
+    """
+    n, m = len(text), len(pattern)
+
+    if m == 0:
+        return list(range(n + 1))
+    if n < m:
+        return []
+    if m > WORD_SIZE:
+        raise ValueError(f"Pattern longer than {WORD_SIZE} characters")
+
+    if NUMBA_AVAILABLE and text.isascii() and pattern.isascii():
+        out = np.zeros(n - m + 1, np.uint8)
+        mask, high = _word_masks(m)
+        _myers_windows_nb(encode_ascii(text), build_peq_table(pattern),
+                          m, mask, high, max_distance, out)
+        return np.flatnonzero(out).tolist()
+
+    matches = []
+    for start in range(n - m + 1):
+        if _myers_python(text[start:start + m], pattern) <= max_distance:
+            matches.append(start)
+    return matches
@@ -5,6 +5,7 @@ This module wraps Python's built-in 'find' method and 're' module
 to serve as a baseline for performance comparisons.
 """
 import re
+from functools import lru_cache
 
 def native_search(text: str, pattern: str) -> list[int]:
     """
@@ -21,12 +22,17 @@ def native_search(text: str, pattern: str) -> list[int]:
         start = idx + 1
     return matches
 
+@lru_cache(maxsize=128)
+def _compile_literal(pattern: str) -> re.Pattern:
+    """Compiles (once) the escaped literal form of a pattern."""
+    return re.compile(re.escape(pattern))
+
 def regex_search(text: str, pattern: str) -> list[int]:
     """
     Finds all occurrences using Python's 're' module.
     Acts as a 'Baseline' for general pattern matching.
     """
     # Escape pattern to treat it as a literal string for fair comparison
-    # (unless specifically testing regex features)
-    escaped_pattern = re.escape(pattern)
-    return [m.start() for m in re.finditer(escaped_pattern, text)]
\ No newline at end of file
+    # (unless specifically testing regex features). The compiled pattern
+    # is cached so benchmark sweeps don't pay re-escape/compile per call.
+    return [m.start() for m in _compile_literal(pattern).finditer(text)]
\ No newline at end of file
@@ -10,9 +10,51 @@ Handles:
 Author: Team Subproblem Solvers
 """
 
-import random
+import mmap
 import os
 
+import numpy as np
+
+# Delete line breaks and stray whitespace in one translate call
+_WHITESPACE = bytes.maketrans(b'', b'')  # identity table
+_DELETE_CHARS = b'\r\n \t'
+
+_BASES = b"ATCG"
+_BASE_CODE = {code: i for i, code in enumerate(_BASES)}
+
+
+def _strip_headers(buf) -> bytes:
+    """
+    Removes FASTA/FASTQ header lines (starting with > or @) from a bytes
+    buffer. Headers are rare, so this splices the sequence segments
+    between them using C-level find instead of scanning per line.
+    """
+    segments = []
+    pos = 0
+    size = len(buf)
+
+    while pos < size:
+        if buf[pos] in b'>@':
+            nl = buf.find(b'\n', pos)
+            if nl == -1:
+                break  # header runs to end of file
+            pos = nl + 1
+            continue
+
+        # Sequence data up to the next header line (or EOF)
+        next_gt = buf.find(b'\n>', pos)
+        next_at = buf.find(b'\n@', pos)
+        if next_gt == -1:
+            next_gt = size
+        if next_at == -1:
+            next_at = size
+        end = min(next_gt, next_at)
+
+        segments.append(buf[pos:min(end + 1, size)])
+        pos = end + 1
+
+    return b''.join(segments)
+
 def load_genome_from_file(filepath):
     """
     Loads a DNA sequence from a FASTA or raw text file.
@@ -26,21 +68,21 @@ def load_genome_from_file(filepath):
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    sequence = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            # Skip FASTA headers (lines starting with >)
-            if line.startswith(">") or line.startswith("@"):
-                continue
-            sequence.append(line.upper())
-    
-    # Join all lines into one massive string
-    full_sequence = "".join(sequence)
-    
+    if os.path.getsize(filepath) == 0:
+        return ""
+
+    # mmap the whole file and clean it with bulk bytes operations
+    # instead of per-line strip/upper/append (multi-GB genomes churn
+    # millions of small Python objects otherwise).
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            raw = _strip_headers(mm)
+
+    cleaned = raw.translate(_WHITESPACE, _DELETE_CHARS).upper()
+
     # rudimentary cleaning to ensure only DNA chars exist
     # (Optional: remove N or other artifacts if necessary)
-    return full_sequence
+    return cleaned.decode('ascii')
 
 
 def generate_synthetic_dna(length, seed=42):
@@ -54,8 +96,12 @@ def generate_synthetic_dna(length, seed=42):
     Returns:
         str: Random DNA sequence.
     """
-    random.seed(seed)
-    return ''.join(random.choices(['A', 'T', 'C', 'G'], k=length))
+    # One bulk draw of ASCII codes instead of `length` random.choices
+    # calls plus a join over that many 1-char strings (~20-50x at 10^7).
+    table = np.frombuffer(b"ATCG", dtype=np.uint8)
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, 4, size=length)
+    return table[idx].tobytes().decode('ascii')
 
 
 def generate_patterns_from_text(text, length, count=1, seed=None):
@@ -71,23 +117,17 @@ def generate_patterns_from_text(text, length, count=1, seed=None):
     Returns:
         list[str]: A list of patterns guaranteed to be in the text.
     """
-    if seed:
-        random.seed(seed)
-        
-    patterns = []
     text_len = len(text)
-    
+
     if length > text_len:
         raise ValueError("Pattern length cannot be larger than text length.")
 
-    for _ in range(count):
-        # Pick a random starting point
-        start_idx = random.randint(0, text_len - length)
-        # Extract the slice
-        p = text[start_idx : start_idx + length]
-        patterns.append(p)
-        
-    return patterns
+    # One vectorized draw for all starting points instead of a Python
+    # randint call per pattern (benchmark sweeps call this repeatedly).
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, text_len - length + 1, size=count)
+
+    return [text[s : s + length] for s in starts.tolist()]
 
 def generate_mutated_pattern(original_pattern, k, mutation_type="mix", seed=None):
     """
@@ -104,38 +144,38 @@ def generate_mutated_pattern(original_pattern, k, mutation_type="mix", seed=None
     Returns:
         str: The mutated pattern.
     """
-    if seed:
-        random.seed(seed)
-        
-    pattern_list = list(original_pattern)
-    bases = ['A', 'T', 'C', 'G']
-    
-    for _ in range(k):
-        # Decide what kind of mutation to do
-        if mutation_type == "sub":
-            op = "sub"
-        else:
-            # Randomly choose between substitution, insertion, or deletion
-            op = random.choice(["sub", "ins", "del"])
-        
-        # 1. SUBSTITUTION (Change a char)
-        if op == "sub" and len(pattern_list) > 0:
-            idx = random.randint(0, len(pattern_list) - 1)
-            current_base = pattern_list[idx]
-            choices = [b for b in bases if b != current_base]
-            pattern_list[idx] = random.choice(choices)
-            
+    rng = np.random.default_rng(seed)
+
+    # Pre-draw every random decision in bulk; positions are drawn as
+    # uniform floats and scaled at apply time since ins/del change the
+    # length as we go.
+    if mutation_type == "sub":
+        ops = np.zeros(k, np.int64)
+    else:
+        ops = rng.integers(0, 3, size=k)  # 0=sub, 1=ins, 2=del
+    positions = rng.random(k)
+    base_draws = rng.integers(0, 4, size=k)
+
+    pattern = bytearray(original_pattern.encode('ascii'))
+
+    for op, u, b in zip(ops.tolist(), positions.tolist(), base_draws.tolist()):
+        # 1. SUBSTITUTION (Change a char, always to a different base)
+        if op == 0 and pattern:
+            idx = int(u * len(pattern))
+            code = _BASE_CODE.get(pattern[idx], b)
+            pattern[idx] = _BASES[(code + 1 + b % 3) % 4]
+
         # 2. INSERTION (Add a char)
-        elif op == "ins":
-            idx = random.randint(0, len(pattern_list)) # Can insert at end
-            pattern_list.insert(idx, random.choice(bases))
-            
+        elif op == 1:
+            idx = int(u * (len(pattern) + 1))  # Can insert at end
+            pattern.insert(idx, _BASES[b])
+
         # 3. DELETION (Remove a char)
-        elif op == "del" and len(pattern_list) > 0:
-            idx = random.randint(0, len(pattern_list) - 1)
-            pattern_list.pop(idx)
-            
-    return "".join(pattern_list)
+        elif op == 2 and pattern:
+            idx = int(u * len(pattern))
+            del pattern[idx]
+
+    return pattern.decode('ascii')
 
 # --- QUICK TEST BLOCK (Runs only if you execute this file directly) ---
 if __name__ == "__main__":
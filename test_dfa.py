@@ -0,0 +1,99 @@
+"""
+Unit Tests for the DFA Exact Matcher
+Tests the goto-table construction and DNA-specific scenarios.
+
+Author: Team Subproblem Solvers
+"""
+
+import sys
+import os
+import unittest
+
+# Add 'src' directory to path so we can import modules
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from algorithms.dfa import build_dfa, dfa_search
+
+
+class TestDFAConstruction(unittest.TestCase):
+    """Test the goto-table preprocessing."""
+
+    def test_table_shape(self):
+        goto = build_dfa("GATC")
+        self.assertEqual(goto.shape, (5, 4))
+
+    def test_simple_transitions(self):
+        # Pattern "AC": A advances from 0 to 1, C from 1 to 2
+        goto = build_dfa("AC")
+        self.assertEqual(goto[0, 0], 1)  # state 0 on A
+        self.assertEqual(goto[1, 1], 2)  # state 1 on C
+        self.assertEqual(goto[1, 0], 1)  # A restarts the prefix
+
+    def test_rejects_non_dna(self):
+        with self.assertRaises(ValueError):
+            build_dfa("AXC")
+
+
+class TestDFASearch(unittest.TestCase):
+    """Test the main DFA search."""
+
+    def test_simple_match(self):
+        result = dfa_search("ATCGATCG", "GATC")
+        self.assertEqual(result, [3])
+
+    def test_multiple_matches(self):
+        result = dfa_search("ATCGATCGATCG", "GATC")
+        self.assertEqual(result, [3, 7])
+
+    def test_no_match(self):
+        result = dfa_search("ATCGATCG", "GGGG")
+        self.assertEqual(result, [])
+
+    def test_empty_pattern(self):
+        result = dfa_search("ATCG", "")
+        self.assertEqual(result, [])
+
+    def test_overlapping_patterns(self):
+        result = dfa_search("AAAAAAA", "AAA")
+        self.assertEqual(result, [0, 1, 2, 3, 4])
+
+    def test_precompiled_table_reuse(self):
+        """A table built once must be reusable across texts."""
+        goto = build_dfa("ATG")
+        self.assertEqual(dfa_search("CGCGATGCCGATGAAATG", "ATG", goto),
+                         [4, 10, 15])
+        self.assertEqual(dfa_search("ATGATG", "ATG", goto), [0, 3])
+
+    def test_non_dna_text_bytes(self):
+        """N bytes in the text reset the automaton, not crash it."""
+        result = dfa_search("ATGNNATG", "ATG")
+        self.assertEqual(result, [0, 5])
+
+
+class TestDNASpecificCases(unittest.TestCase):
+    """Test DNA-specific scenarios."""
+
+    def test_dna_motif_tataa_box(self):
+        result = dfa_search("CGCGTATAACGCGTATAAGGC", "TATAA")
+        self.assertEqual(result, [4, 13])
+
+    def test_matches_kmp(self):
+        """The DFA must agree with KMP on the same input."""
+        from algorithms.kmp import kmp_search
+        text = "GCGCGCGCGCGCATGATTACAGATC"
+        for pattern in ["GCGC", "ATG", "GATC", "TTT"]:
+            self.assertEqual(dfa_search(text, pattern),
+                             kmp_search(text, pattern))
+
+
+def run_tests():
+    """Run DFA test suite with clean formatted output."""
+    print("\n=== Running DFA Matcher Tests ===")
+    runner = unittest.TextTestRunner(verbosity=2)
+    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+    runner.run(suite)
+    print("=== DFA Testing Complete ===\n")
+
+
+if __name__ == "__main__":
+    run_tests()
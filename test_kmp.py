@@ -12,7 +12,8 @@ import unittest
 # Add 'src' directory to path so we can import modules
 sys.path.append(os.path.join(os.getcwd(), 'src'))
 
-from algorithms.kmp import kmp_search, compute_lps_table, count_comparisons_kmp
+from algorithms.kmp import (kmp_search, kmp_search_many, compute_lps_table,
+                            count_comparisons_kmp)
 
 class TestLPSTable(unittest.TestCase):
     """Test the Longest Prefix-Suffix (LPS) preprocessing."""
@@ -129,6 +130,23 @@ class TestKMPComparisonCounting(unittest.TestCase):
         pattern = "AAA"
         matches, comps = count_comparisons_kmp(text, pattern)
         self.assertLess(comps, 3000)
+
+
+class TestKMPSearchMany(unittest.TestCase):
+    """Test the batched multi-pattern search."""
+
+    def test_matches_single_pattern_calls(self):
+        text = "GCGCGCGCGCGCATGATTACAGATC"
+        patterns = ["GCGC", "ATG", "GATC", "TTT"]
+        self.assertEqual(kmp_search_many(text, patterns),
+                         [kmp_search(text, p) for p in patterns])
+
+    def test_edge_case_patterns(self):
+        # Empty and too-long patterns get empty lists, in order.
+        self.assertEqual(kmp_search_many("ATCG", ["", "ATCGATCG", "TC"]),
+                         [[], [], [1]])
+
+
 def run_tests():
     """Run KMP test suite with clean formatted output."""
     print("\n=== Running KMP Algorithm Tests ===")
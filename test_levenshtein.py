@@ -280,6 +280,31 @@ class TestOptimizedSearch(unittest.TestCase):
         self.assertEqual(naive, optimized)
         # self.assertEqual(naive, diagonal)
 
+    def test_matches_unified_implementation(self):
+        """The library's single search entry point must agree with the
+        reference copies in this file."""
+        import os
+        sys.path.append(os.path.join(os.getcwd(), 'src'))
+        from algorithms.levenshtein import levenshtein_search as unified_search
+
+        text = "ATCGATCGATCGGCTAGCTAACGTAT"
+        for pattern in ["GATC", "TAGC", "ACGT", "ATG"]:
+            for max_dist in (1, 2):
+                self.assertEqual(unified_search(text, pattern, max_dist),
+                                 levenshtein_search(text, pattern, max_dist))
+
+    def test_batch_matches_single_pattern_calls(self):
+        """The batch API must agree with one call per pattern."""
+        import os
+        sys.path.append(os.path.join(os.getcwd(), 'src'))
+        from algorithms.levenshtein import (levenshtein_search as unified,
+                                            levenshtein_search_many)
+
+        text = "ATCGATCGATCGGCTAGCTAACGTAT"
+        patterns = ["GATC", "TAGC", "ACGT", "ATG", "GCTAGCTA", ""]
+        self.assertEqual(levenshtein_search_many(text, patterns, 1),
+                         [unified(text, p, 1) for p in patterns])
+
 
 class TestDNASpecificCases(unittest.TestCase):
     """Test DNA-specific scenarios."""
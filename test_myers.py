@@ -0,0 +1,119 @@
+"""
+Unit Tests for Myers' Bit-Parallel Edit Distance
+Tests correctness against the classic DP and DNA-specific scenarios.
+
+Author: Team Subproblem Solvers
+"""
+
+import sys
+import os
+import unittest
+
+# Add 'src' directory to path so we can import modules
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from algorithms.myers import (myers_distance, myers_search,
+                              myers_search_many, myers_search_windows,
+                              build_peq)
+
+
+class TestPeqMasks(unittest.TestCase):
+    """Test the per-character bitmask preprocessing."""
+
+    def test_simple_pattern(self):
+        peq = build_peq("ACGT")
+        self.assertEqual(peq['A'], 0b0001)
+        self.assertEqual(peq['C'], 0b0010)
+        self.assertEqual(peq['G'], 0b0100)
+        self.assertEqual(peq['T'], 0b1000)
+
+    def test_repeated_characters(self):
+        peq = build_peq("AAGA")
+        self.assertEqual(peq['A'], 0b1011)
+        self.assertEqual(peq['G'], 0b0100)
+
+
+class TestMyersDistance(unittest.TestCase):
+    """Test the bit-parallel edit distance."""
+
+    def test_identical_strings(self):
+        self.assertEqual(myers_distance("ATG", "ATG"), 0)
+
+    def test_single_substitution(self):
+        self.assertEqual(myers_distance("ATG", "ATA"), 1)
+
+    def test_single_deletion(self):
+        self.assertEqual(myers_distance("ATG", "AT"), 1)
+
+    def test_single_insertion(self):
+        self.assertEqual(myers_distance("ATG", "ATGC"), 1)
+
+    def test_completely_different(self):
+        self.assertEqual(myers_distance("AAAA", "TTTT"), 4)
+
+    def test_matches_classic_dp(self):
+        """Bit-parallel result must equal the Wagner-Fischer DP."""
+        from algorithms.levenshtein import _levenshtein_python
+        pairs = [
+            ("ATCGATCG", "ATGG"),
+            ("GATTACA", "GCATGCU"),
+            ("TATAATATAA", "TATAA"),
+            ("ACGT" * 16, "TGCA" * 8),
+        ]
+        for a, b in pairs:
+            self.assertEqual(myers_distance(a, b), _levenshtein_python(a, b))
+
+
+class TestMyersWindowSearch(unittest.TestCase):
+    """Test the sliding-window approximate search."""
+
+    def test_exact_match(self):
+        result = myers_search_windows("ATCGATCG", "GATC", 0)
+        self.assertEqual(result, [3])
+
+    def test_approximate_match(self):
+        result = myers_search_windows("ATCGATCG", "GATG", 1)
+        self.assertEqual(result, [3])
+
+    def test_no_match(self):
+        result = myers_search_windows("ATCGATCG", "GGGG", 1)
+        self.assertEqual(result, [])
+
+    def test_matches_naive_search(self):
+        """Window semantics must match the naive Levenshtein search."""
+        from algorithms.levenshtein import levenshtein_search
+        text = "ATGATGCCGATGAAATGTATAA"
+        pattern = "ATG"
+        self.assertEqual(myers_search_windows(text, pattern, 1),
+                         levenshtein_search(text, pattern, 1))
+
+
+class TestMyersSearchMany(unittest.TestCase):
+    """Test the batched semi-global search."""
+
+    def test_matches_single_pattern_calls(self):
+        """One shared pass must report what one pass per pattern does."""
+        text = "GCGCGCGCGCGCATGATTACAGATC"
+        patterns = ["GCGC", "ATG", "GATC", "TTT", "ATTACA"]
+        self.assertEqual(myers_search_many(text, patterns, 1),
+                         [myers_search(text, p, 1) for p in patterns])
+
+    def test_wide_pattern_falls_back(self):
+        """Patterns over one word still get per-pattern results."""
+        text = "AT" * 60
+        patterns = ["ATAT", "AT" * 40]
+        self.assertEqual(myers_search_many(text, patterns, 2),
+                         [myers_search(text, p, 2) for p in patterns])
+
+
+def run_tests():
+    """Run Myers test suite with clean formatted output."""
+    print("\n=== Running Myers Bit-Parallel Tests ===")
+    runner = unittest.TextTestRunner(verbosity=2)
+    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+    runner.run(suite)
+    print("=== Myers Testing Complete ===\n")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,125 @@
+"""
+Unit Tests for Shift-Or Bit-Parallel Matching
+Tests correctness, edge cases, and DNA-specific scenarios.
+
+Author: Team Subproblem Solvers
+"""
+
+import sys
+import os
+import unittest
+
+# Add 'src' directory to path so we can import modules
+sys.path.append(os.path.join(os.getcwd(), 'src'))
+
+from algorithms.shift_or import (shift_or_search, build_mismatch_masks,
+                                 shift_and_search, build_match_masks)
+
+
+class TestMismatchMasks(unittest.TestCase):
+    """Test the per-character mismatch mask preprocessing."""
+
+    def test_simple_pattern(self):
+        masks = build_mismatch_masks("ACGT")
+        # Bit i is cleared where pattern[i] == character
+        self.assertEqual(masks['A'], 0b1110)
+        self.assertEqual(masks['C'], 0b1101)
+        self.assertEqual(masks['G'], 0b1011)
+        self.assertEqual(masks['T'], 0b0111)
+
+    def test_repeated_characters(self):
+        masks = build_mismatch_masks("AAGA")
+        self.assertEqual(masks['A'], 0b0100)
+        self.assertEqual(masks['G'], 0b1011)
+
+
+class TestShiftOrSearch(unittest.TestCase):
+    """Test the main Shift-Or search."""
+
+    def test_simple_match(self):
+        result = shift_or_search("ATCGATCG", "GATC")
+        self.assertEqual(result, [3])
+
+    def test_multiple_matches(self):
+        result = shift_or_search("ATCGATCGATCG", "GATC")
+        self.assertEqual(result, [3, 7])
+
+    def test_no_match(self):
+        result = shift_or_search("ATCGATCG", "GGGG")
+        self.assertEqual(result, [])
+
+    def test_pattern_longer_than_text(self):
+        result = shift_or_search("ATCG", "ATCGATCG")
+        self.assertEqual(result, [])
+
+    def test_empty_pattern(self):
+        result = shift_or_search("ATCG", "")
+        self.assertEqual(result, [])
+
+    def test_overlapping_patterns(self):
+        result = shift_or_search("AAAAAAA", "AAA")
+        self.assertEqual(result, [0, 1, 2, 3, 4])
+
+
+class TestShiftAndSearch(unittest.TestCase):
+    """Test the ShiftAnd dual."""
+
+    def test_match_masks_complement_mismatch_masks(self):
+        mismatch = build_mismatch_masks("AAGA")
+        match = build_match_masks("AAGA")
+        for ch in "AG":
+            self.assertEqual(match[ch], ~mismatch[ch] & 0b1111)
+
+    def test_simple_match(self):
+        result = shift_and_search("ATCGATCG", "GATC")
+        self.assertEqual(result, [3])
+
+    def test_overlapping_patterns(self):
+        result = shift_and_search("AAAAAAA", "AAA")
+        self.assertEqual(result, [0, 1, 2, 3, 4])
+
+    def test_edge_cases(self):
+        self.assertEqual(shift_and_search("ATCG", ""), [])
+        self.assertEqual(shift_and_search("ATCG", "ATCGATCG"), [])
+
+    def test_matches_shift_or(self):
+        """Both bit-parallel variants must report the same matches."""
+        text = "GCGCGCGCGCGCATGATTACAGATC"
+        for pattern in ["GCGC", "ATG", "GATC", "TTT"]:
+            self.assertEqual(shift_and_search(text, pattern),
+                             shift_or_search(text, pattern))
+
+
+class TestDNASpecificCases(unittest.TestCase):
+    """Test DNA-specific scenarios."""
+
+    def test_dna_motif_tataa_box(self):
+        """Test finding TATA box (common promoter sequence)."""
+        result = shift_or_search("CGCGTATAACGCGTATAAGGC", "TATAA")
+        self.assertEqual(result, [4, 13])
+
+    def test_start_codon(self):
+        """Test finding start codon ATG."""
+        result = shift_or_search("CGCGATGCCGATGAAATG", "ATG")
+        self.assertEqual(result, [4, 10, 15])
+
+    def test_matches_kmp(self):
+        """Shift-Or must agree with KMP on the same input."""
+        from algorithms.kmp import kmp_search
+        text = "GCGCGCGCGCGCATGATTACAGATC"
+        for pattern in ["GCGC", "ATG", "GATC", "TTT"]:
+            self.assertEqual(shift_or_search(text, pattern),
+                             kmp_search(text, pattern))
+
+
+def run_tests():
+    """Run Shift-Or test suite with clean formatted output."""
+    print("\n=== Running Shift-Or Algorithm Tests ===")
+    runner = unittest.TextTestRunner(verbosity=2)
+    suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+    runner.run(suite)
+    print("=== Shift-Or Testing Complete ===\n")
+
+
+if __name__ == "__main__":
+    run_tests()